@@ -1,5 +1,8 @@
 from segmentation.segmenter import Segmenter
-from segmentation.settings.root import Settings as SegmentationSettings
+from segmentation.settings.root import (
+    Settings as SegmentationSettings,
+    get_settings as get_segmentation_settings,
+)
 from segmentation.strategy.base import BaseStrategy as SegmentationStrategy
 from segmentation.exceptions import (
     SegmentationError,
@@ -22,6 +25,7 @@
 __all__ = [
     "Segmenter",
     "SegmentationSettings",
+    "get_segmentation_settings",
     "SegmentationStrategy",
     "SegmentationError",
     "AudioLoadError",
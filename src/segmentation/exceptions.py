@@ -1,12 +1,14 @@
 class SegmentationError(Exception):
     """Base exception for all segmentation-related errors."""
 
-    pass
+    __slots__ = ()
 
 
 class AudioLoadError(SegmentationError):
     """Raised when audio file cannot be loaded or read."""
 
+    __slots__ = ("file_path", "reason")
+
     def __init__(self, file_path: str, reason: str):
         self.file_path = file_path
         self.reason = reason
@@ -16,22 +18,25 @@ def __init__(self, file_path: str, reason: str):
 class AudioFormatError(SegmentationError):
     """Raised when audio format is invalid or unsupported."""
 
+    __slots__ = ("file_path", "expected_format")
+
     def __init__(
         self, file_path: str, expected_format: str = None, details: str = None
     ):
         self.file_path = file_path
         self.expected_format = expected_format
-        message = f"Invalid audio format for '{file_path}'"
-        if expected_format:
-            message += f" (expected: {expected_format})"
-        if details:
-            message += f": {details}"
-        super().__init__(message)
+        super().__init__(
+            f"Invalid audio format for '{file_path}'"
+            f"{f' (expected: {expected_format})' if expected_format else ''}"
+            f"{f': {details}' if details else ''}"
+        )
 
 
 class AudioDataError(SegmentationError):
     """Raised when audio data is invalid or corrupted."""
 
+    __slots__ = ("details",)
+
     def __init__(self, details: str):
         self.details = details
         super().__init__(f"Invalid audio data: {details}")
@@ -40,6 +45,8 @@ def __init__(self, details: str):
 class SegmentWriteError(SegmentationError):
     """Raised when segment cannot be written to disk."""
 
+    __slots__ = ("output_path", "reason")
+
     def __init__(self, output_path: str, reason: str):
         self.output_path = output_path
         self.reason = reason
@@ -49,18 +56,21 @@ def __init__(self, output_path: str, reason: str):
 class InvalidTimestampError(SegmentationError):
     """Raised when segment timestamps are invalid."""
 
+    __slots__ = ("start", "end")
+
     def __init__(self, start: float, end: float, reason: str = None):
         self.start = start
         self.end = end
-        message = f"Invalid timestamp range [{start}, {end}]"
-        if reason:
-            message += f": {reason}"
-        super().__init__(message)
+        super().__init__(
+            f"Invalid timestamp range [{start}, {end}]{f': {reason}' if reason else ''}"
+        )
 
 
 class StrategyError(SegmentationError):
     """Raised when segmentation strategy encounters an error."""
 
+    __slots__ = ("strategy_name", "reason")
+
     def __init__(self, strategy_name: str, reason: str):
         self.strategy_name = strategy_name
         self.reason = reason
@@ -70,6 +80,8 @@ def __init__(self, strategy_name: str, reason: str):
 class ConfigurationError(SegmentationError):
     """Raised when configuration or settings are invalid."""
 
+    __slots__ = ("setting_name", "value", "reason")
+
     def __init__(self, setting_name: str, value: any, reason: str):
         self.setting_name = setting_name
         self.value = value
@@ -82,6 +94,8 @@ def __init__(self, setting_name: str, value: any, reason: str):
 class OutputDirectoryError(SegmentationError):
     """Raised when output directory cannot be created or accessed."""
 
+    __slots__ = ("directory_path", "reason")
+
     def __init__(self, directory_path: str, reason: str):
         self.directory_path = directory_path
         self.reason = reason
@@ -91,6 +105,8 @@ def __init__(self, directory_path: str, reason: str):
 class ManifestError(SegmentationError):
     """Raised when manifest file cannot be created or is invalid."""
 
+    __slots__ = ("manifest_path", "reason")
+
     def __init__(self, manifest_path: str, reason: str):
         self.manifest_path = manifest_path
         self.reason = reason
@@ -100,6 +116,8 @@ def __init__(self, manifest_path: str, reason: str):
 class TemplateError(SegmentationError):
     """Raised when filename template formatting fails."""
 
+    __slots__ = ("template", "reason")
+
     def __init__(self, template: str, reason: str):
         self.template = template
         self.reason = reason
@@ -109,6 +127,8 @@ def __init__(self, template: str, reason: str):
 class DurationError(SegmentationError):
     """Raised when duration constraints are violated or inconsistent."""
 
+    __slots__ = ("constraint_name", "value", "reason")
+
     def __init__(self, constraint_name: str, value: float, reason: str):
         self.constraint_name = constraint_name
         self.value = value
@@ -121,6 +141,8 @@ def __init__(self, constraint_name: str, value: float, reason: str):
 class SegmentProcessingError(SegmentationError):
     """Raised when segment processing operations fail (merge, split, overlap)."""
 
+    __slots__ = ("operation", "reason")
+
     def __init__(self, operation: str, reason: str):
         self.operation = operation
         self.reason = reason
@@ -130,16 +152,19 @@ def __init__(self, operation: str, reason: str):
 class EmptySegmentationError(SegmentationError):
     """Raised when segmentation produces no valid segments."""
 
+    __slots__ = ()
+
     def __init__(self, reason: str = None):
-        message = "Segmentation produced no valid segments"
-        if reason:
-            message += f": {reason}"
-        super().__init__(message)
+        super().__init__(
+            f"Segmentation produced no valid segments{f': {reason}' if reason else ''}"
+        )
 
 
 class SilenceDetectionError(StrategyError):
     """Raised when silence detection fails in the silence strategy."""
 
+    __slots__ = ()
+
     def __init__(self, reason: str):
         super().__init__("SilenceStrategy", f"Silence detection failed: {reason}")
         self.reason = reason
@@ -1,27 +1,31 @@
 from logging import getLogger, WARNING
+from typing import Optional
 
 from segmentation.settings.logging import LoggingSettings
+from segmentation.settings.root import get_settings
 
+# Libraries used by the segmentation application whose loggers should be silenced
+EXTERNAL_LOGGERS = (
+    "librosa",
+    "numpy",
+    "pydantic",
+    "pydantic_settings",
+    "soundfile",
+)
 
-def configure_logging(settings: LoggingSettings) -> None:
+
+def configure_logging(settings: Optional[LoggingSettings] = None) -> None:
     """
     Configures the logging for the segmentation application based on the provided settings.
 
     Args:
-        settings (LoggingSettings): The logging settings to configure the logger.
+        settings (Optional[LoggingSettings]): The logging settings to configure the logger. If None, the logging section of the cached environment-based Settings is used.
     """
+    settings = settings or get_settings().logging
+
     segmentation_logger = getLogger("segmentation")
     segmentation_logger.setLevel(settings.log_level.value)
 
     if settings.silence_external_loggers:
-        # List of libraries used by the segmentation application whose loggers should be silenced
-        external_loggers = [
-            "librosa",
-            "numpy",
-            "pydantic",
-            "pydantic_settings",
-            "soundfile",
-        ]
-
-        for logger in external_loggers:
+        for logger in EXTERNAL_LOGGERS:
             getLogger(logger).setLevel(WARNING)
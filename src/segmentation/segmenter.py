@@ -1,11 +1,12 @@
-from logging import getLogger
+from functools import partial
+from logging import INFO, getLogger
 from pathlib import Path
-from typing import Dict, List, Tuple, Union, Optional
+from typing import Callable, Dict, List, Tuple, Union, Optional
 
 from numpy import ndarray
 
 from segmentation.exceptions import SegmentationError
-from segmentation.settings.root import Settings as SegmentationSettings
+from segmentation.settings.root import Settings as SegmentationSettings, get_settings
 from segmentation.strategy.base import BaseStrategy as SegmentationStrategy
 from segmentation.utilities.validators import validate_audio_input
 
@@ -31,10 +32,78 @@ def __init__(
 
         Args:
             strategy (SegmentationStrategy): The segmentation strategy to use.
-            settings (Optional[SegmentationSettings]): The configuration settings for segmentation. If None, defaults to environment-based Settings.
+            settings (Optional[SegmentationSettings]): The configuration settings for segmentation. If None, defaults to the cached environment-based Settings.
         """
+        self.settings = settings or get_settings()
         self.strategy = strategy
-        self.settings = settings or SegmentationSettings()
+
+    @property
+    def strategy(self) -> SegmentationStrategy:
+        """
+        The segmentation strategy in use. Assigning a new one rebuilds the dispatch table.
+        """
+        return self._strategy
+
+    @strategy.setter
+    def strategy(self, strategy: SegmentationStrategy) -> None:
+        self._strategy = strategy
+        self._dispatch = self._build_dispatch(strategy)
+
+    @staticmethod
+    def _build_dispatch(strategy: SegmentationStrategy) -> tuple:
+        """
+        Binds the strategy entry points into a table indexed by [output_to_file][is_path].
+
+        Args:
+            strategy (SegmentationStrategy): The segmentation strategy to dispatch to.
+        Returns:
+            tuple: The entry points, each taking the audio input as its only argument.
+        """
+        return (
+            (
+                strategy.segment_array_to_timestamps,
+                partial(
+                    Segmenter._segment_file,
+                    strategy.segment_file_to_timestamps,
+                    strategy.segment_file_to_timestamps_streaming,
+                    strategy,
+                ),
+            ),
+            (
+                partial(strategy.segment_array_to_files, original_name="array_input"),
+                partial(
+                    Segmenter._segment_file,
+                    strategy.segment_file_to_files,
+                    strategy.segment_file_to_files_streaming,
+                    strategy,
+                ),
+            ),
+        )
+
+    @staticmethod
+    def _segment_file(
+        segment_file: Callable[[Path], SegmentResult],
+        segment_file_streaming: Callable[..., SegmentResult],
+        strategy: SegmentationStrategy,
+        file_path: Path,
+    ) -> SegmentResult:
+        """
+        Segments a file whole, or block by block when the strategy's audio settings ask for it.
+
+        The setting is read on every call, so replacing the strategy's audio settings takes effect.
+
+        Args:
+            segment_file (Callable[[Path], SegmentResult]): The entry point for whole-file loading.
+            segment_file_streaming (Callable[..., SegmentResult]): The entry point for block-by-block loading.
+            strategy (SegmentationStrategy): The strategy both entry points belong to.
+            file_path (Path): Path to the audio file.
+        Returns:
+            SegmentResult: The result of whichever entry point ran.
+        """
+        block_duration = strategy.audio_settings.stream_block_duration
+        if block_duration is None:
+            return segment_file(file_path)
+        return segment_file_streaming(file_path, block_duration=block_duration)
 
     def segment(
         self, audio: Union[str, Path, ndarray], output_to_file: bool = True
@@ -59,31 +128,29 @@ def segment(
         """
         is_path, input_label = validate_audio_input(audio)
 
+        # Resolve the level once so silenced loggers skip the record dispatch
+        log_enabled = logger.isEnabledFor(INFO)
+
         try:
-            if output_to_file:
-                logger.info("Segmenting %s to files.", input_label)
-                if is_path:
-                    segments = self.strategy.segment_file_to_files(
-                        Path(audio).resolve()
-                    )
-                else:
-                    segments = self.strategy.segment_array_to_files(
-                        audio, original_name="array_input"
-                    )
-            else:
-                logger.info("Segmenting %s to timestamps.", input_label)
-                if is_path:
-                    segments = self.strategy.segment_file_to_timestamps(
-                        Path(audio).resolve()
-                    )
-                else:
-                    segments = self.strategy.segment_array_to_timestamps(audio)
-
-            logger.info(
-                "Segmentation complete. Generated %d items for %s.",
-                len(segments),
-                input_label,
-            )
+            # Resolve the input path a single time for whichever branch runs
+            file_path = Path(audio).resolve() if is_path else None
+
+            if log_enabled:
+                logger.info(
+                    "Segmenting %s to %s.",
+                    input_label,
+                    "files" if output_to_file else "timestamps",
+                )
+
+            segment_function = self._dispatch[bool(output_to_file)][is_path]
+            segments = segment_function(file_path if is_path else audio)
+
+            if log_enabled:
+                logger.info(
+                    "Segmentation complete. Generated %d items for %s.",
+                    len(segments),
+                    input_label,
+                )
 
             return segments
         except SegmentationError:
@@ -1,4 +1,4 @@
-from segmentation.settings.root import Settings
+from segmentation.settings.root import Settings, get_settings
 
 
-__all__ = ["Settings"]
+__all__ = ["Settings", "get_settings"]
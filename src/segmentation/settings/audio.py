@@ -1,6 +1,26 @@
+from enum import StrEnum
+from typing import Optional
+
 from pydantic import BaseModel, Field
 
 
+class ResampleType(StrEnum):
+    """
+    Enumeration of the resampling methods available with the package dependencies.
+
+    The soxr methods call libsoxr directly; the others go through librosa.resample and scipy.
+    """
+
+    SOXR_VHQ = "soxr_vhq"
+    SOXR_HQ = "soxr_hq"
+    SOXR_MQ = "soxr_mq"
+    SOXR_LQ = "soxr_lq"
+    SOXR_QQ = "soxr_qq"
+    FFT = "fft"
+    SCIPY = "scipy"
+    POLYPHASE = "polyphase"
+
+
 class AudioSettings(BaseModel):
     """
     Settings related to audio configuration.
@@ -9,9 +29,14 @@ class AudioSettings(BaseModel):
         sample_rate_hz (int): The sample rate for audio processing in Hz.
         channels (int): The number of audio channels (1 for mono, 2 for stereo).
         strict_validation (bool): Whether to enforce strict validation on audio inputs.
+        res_type (ResampleType): The resampling method used when a file's sample rate differs from sample_rate_hz.
+        stream_block_duration (Optional[float]): If set, files are decoded and analysed in blocks of this many seconds instead of being loaded whole.
     """
 
-    model_config = {"extra": "forbid"}  # Forbid extra fields in audio settings
+    model_config = {
+        "extra": "forbid",  # Forbid extra fields in audio settings
+        "frozen": True,  # Settings are immutable once loaded
+    }
 
     sample_rate_hz: int = Field(
         default=16000,
@@ -22,3 +47,17 @@ class AudioSettings(BaseModel):
         default=1,
         description="The number of audio channels (1 for mono, 2 for stereo).",
     )
+
+    res_type: ResampleType = Field(
+        default=ResampleType.SOXR_HQ,
+        description="The resampling method used when a file's sample rate differs from sample_rate_hz. "
+        "soxr methods ('soxr_vhq', 'soxr_hq', 'soxr_mq', 'soxr_lq', 'soxr_qq') call libsoxr directly; "
+        "'fft', 'scipy' and 'polyphase' are passed to librosa.resample.",
+    )
+
+    stream_block_duration: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="If set, files are decoded and analysed in blocks of this many seconds instead of being loaded whole. "
+        "Files that need resampling, or that libsndfile cannot decode, are still loaded whole.",
+    )
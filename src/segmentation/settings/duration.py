@@ -13,7 +13,10 @@ class DurationSettings(BaseModel):
         overlap (float): The duration (in seconds) of overlap between consecutive segments to ensure continuity
     """
 
-    model_config = {"extra": "forbid"}  # Forbid extra fields in strategy settings
+    model_config = {
+        "extra": "forbid",  # Forbid extra fields in strategy settings
+        "frozen": True,  # Settings are immutable once loaded
+    }
 
     soft_lower_limit: float = Field(
         default=10.0,
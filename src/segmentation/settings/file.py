@@ -1,5 +1,7 @@
 from enum import StrEnum
 
+from typing import Optional
+
 from pydantic import BaseModel, Field
 
 
@@ -20,6 +22,7 @@ class FileType(StrEnum):
     AAC = "aac"
 
     JSON = "json"  # Added JSON as a file type for manifest files
+    JSONL = "jsonl"  # JSON lines, for the combined manifest file
 
 
 class FileSettings(BaseModel):
@@ -34,9 +37,14 @@ class FileSettings(BaseModel):
         file_format (FileType): The file format for the output segmented files (e.g., 'wav', 'mp3').
         generate_manifest (bool): Whether to generate a manifest file for each segmented audio file.
         manifest_name_template (str): Template for naming the manifest file. Use placeholders like {original_name} and {segment_index}.
+        combined_manifest (bool): Whether to write all manifests of an audio file as lines of a single JSON lines file.
+        write_workers (Optional[int]): Number of threads writing segments in parallel. If None, derived from the CPU count.
     """
 
-    model_config = {"extra": "forbid"}  # Forbid extra fields in file settings
+    model_config = {
+        "extra": "forbid",  # Forbid extra fields in file settings
+        "frozen": True,  # Settings are immutable once loaded
+    }
 
     output_directory: str = Field(
         default="output",
@@ -72,3 +80,14 @@ class FileSettings(BaseModel):
         default="{original_name}_manifest_{segment_index}",
         description="Template for naming the manifest file. Use placeholders like {original_name} and {segment_index}.",
     )
+
+    combined_manifest: bool = Field(
+        default=False,
+        description="Whether to write all manifests of an audio file as lines of a single '{original_name}_manifest.jsonl' file instead of one JSON file per segment.",
+    )
+
+    write_workers: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Number of threads writing segments in parallel. If None, derived from the CPU count.",
+    )
@@ -8,9 +8,10 @@ class SilenceStrategySettings(BaseModel):
     Attributes:
         top_db (float): The threshold (in decibels) below reference to consider as silence.
         min_silence_duration (float): The minimum duration (in seconds) of silence required to trigger a split.
+        prescreen_non_silent (bool): Whether to check cheaply for audio with no silence before running silence detection.
     """
 
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
 
     top_db: float = Field(
         default=30.0,
@@ -31,3 +32,9 @@ class SilenceStrategySettings(BaseModel):
         default=512,
         description="The number of samples between successive analysis frames for silence detection.",
     )
+
+    prescreen_non_silent: bool = Field(
+        default=False,
+        description="Whether to check cheaply for audio with no silence before running silence detection. "
+        "Saves most of the detection time on continuous audio, but adds about a quarter to it when the audio has pauses.",
+    )
@@ -1,6 +1,6 @@
 from enum import StrEnum
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 
 class LogLevel(StrEnum):
@@ -24,7 +24,10 @@ class LoggingSettings(BaseModel):
         silence_external_loggers (bool): Whether to silence loggers from external libraries.
     """
 
-    model_config = {"extra": "forbid"}  # Forbid extra fields in logging settings
+    model_config = {
+        "extra": "forbid",  # Forbid extra fields in logging settings
+        "frozen": True,  # Settings are immutable once loaded
+    }
 
     log_level: LogLevel = Field(
         default=LogLevel.INFO,
@@ -34,3 +37,18 @@ class LoggingSettings(BaseModel):
         default=True,
         description="Whether to silence loggers from external libraries.",
     )
+
+    @field_validator("log_level", mode="before")
+    @classmethod
+    def normalize_log_level(cls, value: object) -> object:
+        """
+        Normalizes the log level to upper case so values such as 'info' are accepted.
+
+        Args:
+            value (object): The raw log level value.
+        Returns:
+            object: The upper-cased log level if a string was given, otherwise the value unchanged.
+        """
+        if isinstance(value, str):
+            return value.upper()
+        return value
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -45,6 +47,20 @@ class Settings(BaseSettings):
         ),
         env_file_encoding="utf-8",
         extra="ignore",  # Ignore extra fields in environment variables
-        validate_assignment=True,  # Validate fields on assignment
+        frozen=True,  # Settings are immutable once loaded; use model_copy(update=...) to derive variants
         case_sensitive=False,  # Environment variables are case-insensitive
     )
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Returns the process-wide settings instance, loading it on first use.
+
+    The environment and the .env files are read once; subsequent calls return the cached instance.
+    Call get_settings.cache_clear() to force a reload.
+
+    Returns:
+        Settings: The cached settings instance.
+    """
+    return Settings()
@@ -1,28 +1,66 @@
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import ExitStack
 from logging import getLogger
+from os import close, cpu_count
 from pathlib import Path
-from typing import Dict, List, Tuple
-
-from numpy import ndarray
 
+from numpy import (
+    argmax,
+    ascontiguousarray,
+    asarray,
+    concatenate,
+    float32,
+    flatnonzero,
+    float64,
+    int64,
+    maximum,
+    minimum,
+    ndarray,
+)
+from soundfile import LibsndfileError, SoundFile
 
-from segmentation.exceptions import InvalidTimestampError, StrategyError
+from segmentation.exceptions import (
+    AudioDataError,
+    InvalidTimestampError,
+    StrategyError,
+)
 from segmentation.settings.audio import AudioSettings
 from segmentation.settings.duration import DurationSettings
 from segmentation.settings.file import FileSettings, FileType
-from segmentation.utilities.filename_formatter import format_filename
-from segmentation.utilities.io.audio_loader import load_audio
-from segmentation.utilities.io.segment_writer import write_segment
-from segmentation.utilities.manifest_builder import Manifest
-from segmentation.utilities.math.time_conversion import seconds_to_samples
+from segmentation.utilities.filename_formatter import compile_filename_template
+from segmentation.utilities.io.audio_loader import (
+    iter_audio_blocks,
+    load_audio,
+    read_audio_range,
+)
+from segmentation.utilities.io.segment_writer import (
+    open_directory,
+    resolve_sound_format,
+    write_segment,
+)
+from segmentation.utilities.manifest_builder import Manifest, ManifestWriter
+from segmentation.utilities.math.segment_merging import merge_short_segments
+from segmentation.utilities.math.time_conversion import (
+    seconds_to_samples,
+    seconds_to_samples_array,
+)
 from segmentation.utilities.output_path_builder import (
     build_output_directory,
     build_path,
+    build_segment_directory,
 )
 
 logger = getLogger(__name__)
 
-Timestamp = Tuple[float, float]
+Timestamp = tuple[float, float]
+
+# Below this many segments, validating timestamps one by one beats the NumPy call overhead
+VECTORIZED_VALIDATION_THRESHOLD = 32
 
 
 class BaseStrategy(ABC):
@@ -39,28 +77,60 @@ def __init__(
             audio_settings (AudioSettings): Settings related to audio configuration.
             duration_settings (DurationSettings): Settings related to duration configuration.
             file_settings (FileSettings): Settings related to file configuration.
+        Raises:
+            TemplateError: If a naming template contains invalid placeholders.
         """
         self.audio_settings = audio_settings
         self.duration_settings = duration_settings
         self.file_settings = file_settings
 
+        # Naming templates are validated and bound once instead of per segment
+        self._format_segment_filename = compile_filename_template(
+            file_settings.name_template, file_settings.file_format
+        )
+        self._format_manifest_filename = compile_filename_template(
+            file_settings.manifest_name_template, FileType.JSON
+        )
+
+        # Resolved once so libsndfile does not infer the format from every segment's extension
+        self._sound_format, self._sound_subtype = resolve_sound_format(
+            file_settings.file_format
+        )
+
         logger.debug("Initialized %s strategy", self.__class__.__name__)
 
     @abstractmethod
-    def segment_array_to_timestamps(self, audio: ndarray) -> List[Timestamp]:
+    def segment_array_to_timestamps(self, audio: ndarray) -> list[Timestamp]:
         """
         Abstract method to segment an audio array into timestamps.
 
         Args:
             audio (ndarray): The input audio array.
         Returns:
-            List[Timestamp]: A list of (start, end) timestamps in seconds.
+            list[Timestamp]: A list of (start, end) timestamps in seconds.
         """
         ...
 
+    def segment_stream_to_timestamps(
+        self, blocks: Iterable[ndarray], audio_length_samples: int
+    ) -> list[Timestamp]:
+        """
+        Segments audio delivered as consecutive blocks into timestamps.
+
+        The default implementation concatenates the blocks and delegates to segment_array_to_timestamps.
+        Strategies that can detect boundaries incrementally should override it to keep memory bounded.
+
+        Args:
+            blocks (Iterable[ndarray]): Consecutive, non-overlapping audio blocks.
+            audio_length_samples (int): The total length of the audio in samples.
+        Returns:
+            list[Timestamp]: A list of (start, end) timestamps in seconds.
+        """
+        return self.segment_array_to_timestamps(concatenate(list(blocks)))
+
     def segment_array_to_files(
         self, audio: ndarray, original_name: str
-    ) -> Dict[str, Path]:
+    ) -> dict[str, Path]:
         """
         Finds timestamps for a given array and writes segments to files.
 
@@ -68,7 +138,7 @@ def segment_array_to_files(
             audio (ndarray): The input audio array.
             original_name (str): The original name of the audio file (used for naming segments).
         Returns:
-            Dict[str, Path]: Mapping of segment filenames to their file paths.
+            dict[str, Path]: Mapping of segment filenames to their file paths.
         """
         logger.info("Processing timestamps for array with shape %s", audio.shape)
 
@@ -79,207 +149,492 @@ def segment_array_to_files(
                 self.__class__.__name__, f"Failed to generate timestamps: {e}"
             ) from e
 
-        segments_data: Dict[str, Path] = {}
+        # One contiguous float32 buffer (C-order, so (samples, channels) rows stay adjacent);
+        # slicing it yields zero-copy views that soundfile writes straight from memory
+        audio = ascontiguousarray(audio, dtype=float32)
 
-        logger.info("Creating %d segments for %s", len(timestamps), original_name)
+        return self._write_segments(
+            timestamps,
+            lambda start_index, end_index: audio[start_index:end_index],
+            len(audio),
+            original_name,
+        )
 
-        for index, (start, end) in enumerate(timestamps):
-            # Validate timestamp
-            if start < 0 or end < 0:
-                raise InvalidTimestampError(start, end, "Timestamps cannot be negative")
-            if start >= end:
-                raise InvalidTimestampError(
-                    start, end, "Start time must be before end time"
-                )
-            if end > len(audio) / self.audio_settings.sample_rate_hz:
-                raise InvalidTimestampError(
-                    start, end, "End time exceeds audio duration"
-                )
+    def segment_file_to_timestamps_streaming(
+        self, file_path: Path, block_duration: float = 30.0
+    ) -> list[Timestamp]:
+        """
+        Finds timestamps for a given file without loading it into memory as a whole.
 
-            start_index = seconds_to_samples(start, self.audio_settings.sample_rate_hz)
-            end_index = seconds_to_samples(end, self.audio_settings.sample_rate_hz)
+        Files that need resampling, or that libsndfile cannot decode, fall back to
+        segment_file_to_timestamps.
 
-            segment_audio = audio[start_index:end_index]
+        Args:
+            file_path (Path): Path to the audio file.
+            block_duration (float): Duration (in seconds) of each block read while detecting segments.
+        Returns:
+            list[Timestamp]: A list of (start, end) timestamps.
+        """
+        logger.info("Processing streaming timestamps for %s", file_path.name)
 
-            # Build output directory for this segment
-            output_directory = build_output_directory(
-                self.file_settings.output_directory,
-                self.file_settings.output_in_subdirectory,
-                self.file_settings.output_segment_in_subdirectory,
-                original_name,
-                segment_index=index,
-            )
+        sound_file = self._open_stream(file_path)
+        if sound_file is None:
+            return self.segment_file_to_timestamps(file_path)
 
-            segment_filename = format_filename(
-                original_name,
-                index,
-                self.file_settings.name_template,
-                self.file_settings.file_format,
+        with sound_file:
+            return self.segment_stream_to_timestamps(
+                self._stream_blocks(sound_file, file_path, block_duration),
+                sound_file.frames,
             )
 
-            manifest_filename = format_filename(
-                original_name,
-                index,
-                self.file_settings.manifest_name_template,
-                FileType.JSON,
+    def segment_file_to_files_streaming(
+        self, file_path: Path, block_duration: float = 30.0
+    ) -> dict[str, Path]:
+        """
+        Segments a file into multiple files without loading it into memory as a whole.
+
+        Timestamps are computed from consecutive blocks of the file, then each segment is read back
+        from disk on its own. Files that need resampling, or that libsndfile cannot decode, fall back
+        to segment_file_to_files.
+
+        Args:
+            file_path (Path): Path to the audio file.
+            block_duration (float): Duration (in seconds) of each block read while detecting segments.
+        Returns:
+            dict[str, Path]: Mapping of segment filenames to their file paths.
+        """
+        logger.info("Processing streaming file segmentation for %s", file_path.name)
+
+        sound_file = self._open_stream(file_path)
+        if sound_file is None:
+            return self.segment_file_to_files(file_path)
+
+        with sound_file:
+            blocks = self._stream_blocks(sound_file, file_path, block_duration)
+
+            try:
+                timestamps = self.segment_stream_to_timestamps(
+                    blocks, sound_file.frames
+                )
+            except Exception as e:
+                raise StrategyError(
+                    self.__class__.__name__, f"Failed to generate timestamps: {e}"
+                ) from e
+
+            channels = self.audio_settings.channels
+
+            return self._write_segments(
+                timestamps,
+                lambda start_index, end_index: read_audio_range(
+                    sound_file, start_index, end_index, channels
+                ),
+                sound_file.frames,
+                file_path.stem,
             )
 
-            segment_path = build_path(output_directory, segment_filename)
-            manifest_path = build_path(output_directory, manifest_filename)
+    def _open_stream(self, file_path: Path) -> SoundFile | None:
+        """
+        Opens a file for block-wise reading if it can be streamed at the configured sample rate.
+
+        Args:
+            file_path (Path): Path to the audio file.
+        Returns:
+            SoundFile | None: The open file, or None if it must be loaded whole instead.
+        """
+        try:
+            sound_file = SoundFile(file_path)
+        except LibsndfileError as e:
+            logger.debug("Cannot stream %s (%s), loading it whole", file_path.name, e)
+            return None
 
-            write_segment(
-                segment_path, segment_audio, self.audio_settings.sample_rate_hz
+        sample_rate = self.audio_settings.sample_rate_hz
+        if sound_file.samplerate != sample_rate:
+            logger.debug(
+                "Cannot stream %s: native sample rate %d differs from %d, loading it whole",
+                file_path.name,
+                sound_file.samplerate,
+                sample_rate,
             )
+            sound_file.close()
+            return None
+
+        return sound_file
+
+    def _stream_blocks(
+        self, sound_file: SoundFile, file_path: Path, block_duration: float
+    ) -> Iterable[ndarray]:
+        """
+        Returns the consecutive blocks of an open file, laid out like load_audio output.
+
+        Args:
+            sound_file (SoundFile): The open audio file.
+            file_path (Path): Path to the audio file.
+            block_duration (float): Duration (in seconds) of each block.
+        Returns:
+            Iterable[ndarray]: The audio blocks.
+        Raises:
+            AudioDataError: If the file holds no audio.
+        """
+        if sound_file.frames == 0:
+            raise AudioDataError(f"Loaded audio from '{file_path}' is empty")
+
+        return iter_audio_blocks(
+            sound_file,
+            seconds_to_samples(block_duration, self.audio_settings.sample_rate_hz),
+            self.audio_settings.channels,
+        )
+
+    def _write_segments(
+        self,
+        timestamps: list[Timestamp],
+        read_segment: Callable[[int, int], ndarray],
+        audio_length_samples: int,
+        original_name: str,
+    ) -> dict[str, Path]:
+        """
+        Validates timestamps and writes each segment (and its manifest, if enabled) to disk.
+
+        Segments are read on the calling thread and written by a thread pool; at most twice as many
+        segments as there are workers are held in memory at once. A combined manifest is appended to
+        from the calling thread as segments are queued.
+
+        Args:
+            timestamps (list[Timestamp]): The (start, end) timestamps in seconds.
+            read_segment (Callable[[int, int], ndarray]): Returns the audio between two sample indices.
+            audio_length_samples (int): The total length of the audio in samples.
+            original_name (str): The original name of the audio file (used for naming segments).
+        Returns:
+            dict[str, Path]: Mapping of segment filenames to their file paths.
+        """
+        segments_data: dict[str, Path] = {}
+
+        logger.info("Creating %d segments for %s", len(timestamps), original_name)
+
+        write_workers = self.file_settings.write_workers or min(
+            32, (cpu_count() or 1) * 2
+        )
+        max_pending_writes = write_workers * 2
+        pending_writes: deque[Future] = deque()
+
+        sample_rate = self.audio_settings.sample_rate_hz
+        timestamps_array = asarray(timestamps, dtype=float64).reshape(-1, 2)
+
+        self._validate_timestamps(
+            timestamps, timestamps_array, audio_length_samples / sample_rate
+        )
 
-            if self.file_settings.generate_manifest:
-                manifest = Manifest(
-                    original_file=original_name,
-                    index=index,
-                    segment_file=segment_path.as_posix(),
-                    start_time=start,
-                    end_time=end,
+        # Sample indices for every segment in one vectorized pass
+        sample_indices = seconds_to_samples_array(
+            timestamps_array, sample_rate
+        ).tolist()
+
+        # The audio file's directory is created once; per-segment subdirectories only add a leaf
+        base_directory = build_output_directory(
+            self.file_settings.output_directory,
+            self.file_settings.output_in_subdirectory,
+            False,
+            original_name,
+        )
+        segment_in_subdirectory = self.file_settings.output_segment_in_subdirectory
+
+        manifest_sink: ManifestWriter | None = None
+
+        with ExitStack() as stack:
+            if (
+                self.file_settings.generate_manifest
+                and self.file_settings.combined_manifest
+            ):
+                # Appended to from this thread only, so the writers never contend for it
+                manifest_sink = stack.enter_context(
+                    ManifestWriter(
+                        build_path(
+                            base_directory,
+                            f"{original_name}_manifest.{FileType.JSONL.value}",
+                        )
+                    )
                 )
-                manifest.to_json_file(manifest_path)
 
-            logger.debug(
-                "Segment %d saved: %.2fs - %.2fs -> %s",
-                index,
-                start,
-                end,
-                segment_filename,
+            # Segments sharing the audio file's directory are created relative to one open descriptor
+            directory_fd = None
+            if not segment_in_subdirectory and self._sound_format is not None:
+                directory_fd = open_directory(base_directory)
+                if directory_fd is not None:
+                    stack.callback(close, directory_fd)
+
+            executor = stack.enter_context(
+                ThreadPoolExecutor(max_workers=write_workers)
             )
 
-            segments_data[segment_filename] = segment_path
+            for index, (start, end) in enumerate(timestamps):
+                start_index, end_index = sample_indices[index]
+
+                segment_audio = read_segment(start_index, end_index)
 
-            # Explicitly delete segment_audio to free memory before processing the next segment
-            del segment_audio
+                # Build output directory for this segment
+                output_directory = (
+                    build_segment_directory(base_directory, index)
+                    if segment_in_subdirectory
+                    else base_directory
+                )
+
+                segment_filename = self._format_segment_filename(original_name, index)
+                manifest_filename = self._format_manifest_filename(original_name, index)
+
+                segment_path = build_path(output_directory, segment_filename)
+                manifest_path = build_path(output_directory, manifest_filename)
+
+                manifest = None
+                if self.file_settings.generate_manifest:
+                    manifest = Manifest(
+                        original_file=original_name,
+                        index=index,
+                        segment_file=segment_path.as_posix(),
+                        start_time=start,
+                        end_time=end,
+                    )
+
+                    if manifest_sink is not None:
+                        manifest_sink.write(manifest)
+                        manifest = None
+
+                # Wait for the oldest write before holding more segments in memory
+                if len(pending_writes) >= max_pending_writes:
+                    pending_writes.popleft().result()
+
+                pending_writes.append(
+                    executor.submit(
+                        self._write_segment_files,
+                        segment_path,
+                        segment_audio,
+                        manifest_path,
+                        manifest,
+                        directory_fd,
+                    )
+                )
+
+                logger.debug(
+                    "Segment %d queued: %.2fs - %.2fs -> %s",
+                    index,
+                    start,
+                    end,
+                    segment_filename,
+                )
+
+                segments_data[segment_filename] = segment_path
+
+            # Surface any error raised by the remaining writes
+            while pending_writes:
+                pending_writes.popleft().result()
 
         return segments_data
 
-    def segment_file_to_timestamps(self, file_path: Path) -> List[Timestamp]:
+    def _validate_timestamps(
+        self,
+        timestamps: list[Timestamp],
+        timestamps_array: ndarray,
+        audio_duration: float,
+    ) -> None:
+        """
+        Validates all timestamps before any segment is written.
+
+        Long timestamp lists are checked with a few vectorized reductions; short ones, where the
+        NumPy call overhead dominates, are checked one by one.
+
+        Args:
+            timestamps (list[Timestamp]): The (start, end) timestamps in seconds.
+            timestamps_array (ndarray): The same timestamps as a float64 array shaped (segments, 2).
+            audio_duration (float): The duration of the audio in seconds.
+        Raises:
+            InvalidTimestampError: For the first timestamp that is negative, out of order or past the end of the audio.
+        """
+        if len(timestamps) >= VECTORIZED_VALIDATION_THRESHOLD:
+            negative = (timestamps_array < 0).any(axis=1)
+            unordered = timestamps_array[:, 0] >= timestamps_array[:, 1]
+            overrun = timestamps_array[:, 1] > audio_duration
+            invalid = negative | unordered | overrun
+
+            if not invalid.any():
+                return
+
+            # Only the first offending timestamp needs the scalar checks below
+            timestamps = [timestamps[int(argmax(invalid))]]
+
+        for start, end in timestamps:
+            # One chained comparison for the common valid case; the reason is only worked out on failure
+            if 0 <= start < end <= audio_duration:
+                continue
+
+            if start < 0 or end < 0:
+                raise InvalidTimestampError(start, end, "Timestamps cannot be negative")
+            if start >= end:
+                raise InvalidTimestampError(
+                    start, end, "Start time must be before end time"
+                )
+            if end > audio_duration:
+                raise InvalidTimestampError(
+                    start, end, "End time exceeds audio duration"
+                )
+
+    def _write_segment_files(
+        self,
+        segment_path: Path,
+        segment_audio: ndarray,
+        manifest_path: Path,
+        manifest: Manifest | None,
+        directory_fd: int | None = None,
+    ) -> None:
+        """
+        Writes a single segment and, if given, its manifest. Runs on the segment writer threads.
+
+        Args:
+            segment_path (Path): The path where the audio segment will be saved.
+            segment_audio (ndarray): The audio data of the segment.
+            manifest_path (Path): The path where the manifest will be saved.
+            manifest (Manifest | None): The manifest for the segment, or None if manifests are disabled.
+            directory_fd (int | None): An open descriptor of the segment's directory, if available.
+        """
+        write_segment(
+            segment_path,
+            segment_audio,
+            self.audio_settings.sample_rate_hz,
+            self._sound_format,
+            self._sound_subtype,
+            directory_fd,
+            # _write_segments created the segment's directory before queueing it
+            create_parent=False,
+        )
+
+        if manifest is not None:
+            manifest.to_json_file(manifest_path)
+
+        logger.debug("Segment saved: %s", segment_path.name)
+
+    def segment_file_to_timestamps(self, file_path: Path) -> list[Timestamp]:
         """
         Finds timestamps for a given file.
 
         Args:
             file_path (Path): Path to the audio file.
         Returns:
-            List[Timestamp]: A list of (start, end) timestamps.
+            list[Timestamp]: A list of (start, end) timestamps.
         """
         logger.info("Processing timestamps for %s", file_path.name)
 
         audio = load_audio(
-            file_path, self.audio_settings.sample_rate_hz, self.audio_settings.channels
+            file_path,
+            self.audio_settings.sample_rate_hz,
+            self.audio_settings.channels,
+            self.audio_settings.res_type,
         )
         return self.segment_array_to_timestamps(audio)
 
-    def segment_file_to_files(self, file_path: Path) -> Dict[str, Path]:
+    def segment_file_to_files(self, file_path: Path) -> dict[str, Path]:
         """
         Segments a file into multiple files based on timestamps.
 
         Args:
             file_path (Path): Path to the audio file.
         Returns:
-            Dict[str, Path]: Mapping of segment filenames to their file paths.
+            dict[str, Path]: Mapping of segment filenames to their file paths.
         """
         logger.info("Processing file segmentation for %s", file_path.name)
 
         audio = load_audio(
-            file_path, self.audio_settings.sample_rate_hz, self.audio_settings.channels
+            file_path,
+            self.audio_settings.sample_rate_hz,
+            self.audio_settings.channels,
+            self.audio_settings.res_type,
         )
         return self.segment_array_to_files(audio, file_path.stem)
 
     def _process_raw_segments(
-        self, segments: List[Dict], audio_length_samples: int
-    ) -> List[Timestamp]:
+        self, starts: ndarray, ends: ndarray, audio_length_samples: int
+    ) -> list[Timestamp]:
         """
         Processes raw segments by merging short segments and splitting long segments.
 
         Args:
-            segments (List[Dict]): List of segments with 'start' and 'end' keys.
+            starts (ndarray): Segment start indices in samples.
+            ends (ndarray): Segment end indices in samples.
             audio_length_samples (int): The total length of the audio in samples.
         Returns:
-            List[Timestamp]: List of processed segments.
+            list[Timestamp]: List of processed segments.
         """
-        merged_segments = self._merge_short_segments(segments)
-        overlapped_segments = self._apply_overlap(merged_segments, audio_length_samples)
+        starts, ends = self._merge_short_segments(
+            ascontiguousarray(starts, dtype=int64), ascontiguousarray(ends, dtype=int64)
+        )
+        starts, ends = self._apply_overlap(starts, ends, audio_length_samples)
+
+        sample_rate = self.audio_settings.sample_rate_hz
 
-        timestamps: List[Timestamp] = []
+        start_times = starts / sample_rate
+        end_times = ends / sample_rate
+        durations = (ends - starts) / sample_rate
 
-        for segment in overlapped_segments:
-            duration = (
-                segment["end"] - segment["start"]
-            ) / self.audio_settings.sample_rate_hz
+        too_short = durations < self.duration_settings.hard_lower_limit
+        too_long = durations > self.duration_settings.hard_upper_limit
+        discarded = too_short | too_long
 
-            if duration < self.duration_settings.hard_lower_limit:
+        # Only the (rare) discarded segments are logged one by one
+        for index in flatnonzero(discarded).tolist():
+            if too_short[index]:
                 logger.debug(
                     "Discarding segment %.2f - %.2f (%.2fs) as it is below the hard lower limit.",
-                    segment["start"] / self.audio_settings.sample_rate_hz,
-                    segment["end"] / self.audio_settings.sample_rate_hz,
-                    duration,
+                    start_times[index],
+                    end_times[index],
+                    durations[index],
                 )
-                continue
-
-            if duration > self.duration_settings.hard_upper_limit:
+            else:
                 logger.warning(
                     "Discarding segment %.2f - %.2f (%.2fs) as it exceeds the hard upper limit.",
-                    segment["start"] / self.audio_settings.sample_rate_hz,
-                    segment["end"] / self.audio_settings.sample_rate_hz,
-                    duration,
+                    start_times[index],
+                    end_times[index],
+                    durations[index],
                 )
-                continue
 
-            timestamps.append(
-                (
-                    segment["start"] / self.audio_settings.sample_rate_hz,
-                    segment["end"] / self.audio_settings.sample_rate_hz,
-                )
-            )
-
-        return timestamps
+        kept = ~discarded
+        return list(zip(start_times[kept].tolist(), end_times[kept].tolist()))
 
     def _apply_overlap(
-        self, segments: List[Dict], audio_length_samples: int
-    ) -> List[Dict]:
+        self, starts: ndarray, ends: ndarray, audio_length_samples: int
+    ) -> tuple[ndarray, ndarray]:
         """
         Applies overlap to segments based on the duration settings.
 
         Args:
-            segments (List[Dict]): List of segments with 'start' and 'end' keys.
+            starts (ndarray): Segment start indices in samples.
+            ends (ndarray): Segment end indices in samples.
             audio_length_samples (int): The total length of the audio in samples.
         Returns:
-            List[Dict]: List of segments with applied overlap.
+            tuple[ndarray, ndarray]: The segment starts and ends with applied overlap.
         """
         if self.duration_settings.overlap <= 0:
-            return segments
+            return starts, ends
 
-        padding_samples = int(
-            seconds_to_samples(
-                self.duration_settings.overlap / 2, self.audio_settings.sample_rate_hz
-            )
+        padding_samples = seconds_to_samples(
+            self.duration_settings.overlap / 2, self.audio_settings.sample_rate_hz
         )
 
-        processed_segments = []
-
-        for segment in segments:
-            start = max(0, segment["start"] - padding_samples)
-            end = min(audio_length_samples, segment["end"] + padding_samples)
-
-            processed_segments.append({"start": start, "end": end})
-
-        return processed_segments
+        return (
+            maximum(starts - padding_samples, 0),
+            minimum(ends + padding_samples, audio_length_samples),
+        )
 
-    def _merge_short_segments(self, segments: List[Dict]) -> List[Dict]:
+    def _merge_short_segments(
+        self, starts: ndarray, ends: ndarray
+    ) -> tuple[ndarray, ndarray]:
         """
         Merges segments that are shorter than the minimum duration specified
         in the settings with adjacent segments.
 
         Args:
-            segments (List[Dict]): List of segments with 'start' and 'end' keys.
+            starts (ndarray): Segment start indices in samples (int64).
+            ends (ndarray): Segment end indices in samples (int64).
         Returns:
-            List[Dict]: List of merged segments.
+            tuple[ndarray, ndarray]: The merged segment starts and ends.
         """
-        if not segments:
-            return []
+        if len(starts) == 0:
+            return starts, ends
 
         soft_min_samples = int(
             self.duration_settings.soft_lower_limit * self.audio_settings.sample_rate_hz
@@ -301,69 +656,22 @@ def _merge_short_segments(self, segments: List[Dict]) -> List[Dict]:
             self.duration_settings.maximum_merge_gap_duration * self.audio_settings.sample_rate_hz
         )
 
-        i = 0
-        while i < len(segments):
-            current = segments[i]
-            duration = current["end"] - current["start"]
-
-            # If the segment is acceptable (above soft limit), move on.
-            # (If it's huge, it will be caught by the hard limit filter later)
-            if duration >= soft_min_samples:
-                i += 1
-                continue
-
-            # Segment is too short (undesired). Evaluate merging options.
-            left_segment = segments[i - 1] if i > 0 else None
-            right_segment = segments[i + 1] if i < len(segments) - 1 else None
-
-            can_merge_left = False
-            score_left = float("inf")
-
-            if left_segment:
-                gap = current["start"] - left_segment["end"]
-                new_duration = current["end"] - left_segment["start"]
-                if new_duration <= hard_max_samples and gap <= max_gap_samples:
-                    can_merge_left = True
-                    score_left = abs(new_duration - target_samples)
-
-            can_merge_right = False
-            score_right = float("inf")
-
-            if right_segment:
-                gap = right_segment["start"] - current["end"]
-                new_duration = right_segment["end"] - current["start"]
-                if new_duration <= hard_max_samples and gap <= max_gap_samples:
-                    can_merge_right = True
-                    score_right = abs(new_duration - target_samples)
-
-            if not can_merge_left and not can_merge_right:
-                logger.debug(
-                    "Segment at index %d is short but unmergeable. Keeping for filter.",
-                    i,
-                )
-                i += 1
-                continue
-
-            # Prefer the merge that gets us closer to the target duration
-            if can_merge_left and (not can_merge_right or score_left <= score_right):
-                # Merge Left: Extend previous segment to cover current
-                logger.debug("Merging segment %d LEFT into %d", i, i - 1)
-                left_segment["end"] = current["end"]
-                segments.pop(i)
-                # Decrement i to re-evaluate the newly grown previous segment
-                # (It might still be short, or now eligible for another merge)
-                i -= 1
-
-            elif can_merge_right:
-                # Merge Right: Extend right segment to cover current start
-                logger.debug("Merging segment %d RIGHT into %d", i, i + 1)
-                right_segment["start"] = current["start"]
-                segments.pop(i)
-                # Do NOT increment i. 'right_segment' has shifted into position 'i'.
-                # We stay here to evaluate this new, larger segment.
-                continue
+        if not (ends - starts < soft_min_samples).any():
+            # Every segment is acceptable, nothing to merge
+            return starts, ends
+
+        merged_starts, merged_ends = merge_short_segments(
+            starts,
+            ends,
+            soft_min_samples,
+            hard_max_samples,
+            target_samples,
+            max_gap_samples,
+        )
 
-            # Ensure we don't loop infinitely in edge cases
-            i = max(0, i)
+        logger.debug(
+            "Merged %d short segments into their neighbours",
+            len(starts) - len(merged_starts),
+        )
 
-        return segments
+        return merged_starts, merged_ends
@@ -1,8 +1,24 @@
+from collections.abc import Iterable
 from logging import getLogger
 from typing import List, Optional
 
+from librosa import amplitude_to_db
 from librosa.effects import split
-from numpy import ndarray
+from librosa.feature import rms
+from numpy import (
+    asarray,
+    concatenate,
+    diff,
+    flatnonzero,
+    float64,
+    int64,
+    max as np_max,
+    minimum,
+    ndarray,
+    sqrt,
+    zeros,
+)
+from numpy.lib.stride_tricks import sliding_window_view
 
 from segmentation.strategy.base import BaseStrategy, Timestamp
 from segmentation.settings.audio import AudioSettings
@@ -13,6 +29,155 @@
 
 logger = getLogger(__name__)
 
+# Headroom (in decibels) the pre-screen keeps above the silence threshold, far larger than the
+# float32 rounding differences between its frame energies and librosa's
+PRESCREEN_MARGIN_DB = 0.01
+
+
+def _stream_frame_rms(
+    blocks: Iterable[ndarray], frame_length: int, hop_length: int
+) -> ndarray:
+    """
+    Computes centered frame RMS over consecutive audio blocks, matching librosa.feature.rms.
+
+    Only the samples of the frame straddling a block boundary are carried over between blocks,
+    so memory is bounded by the block size plus one RMS value per frame.
+
+    Args:
+        blocks (Iterable[ndarray]): Consecutive audio blocks laid out as (samples,) or (samples, channels).
+        frame_length (int): The number of samples per analysis frame.
+        hop_length (int): The number of samples between successive analysis frames.
+    Returns:
+        ndarray: RMS per frame, shaped (frames,) or (channels, frames).
+    """
+    padding = frame_length // 2
+    pending = None
+    skip = 0
+    rms_chunks = []
+
+    def padded_blocks() -> Iterable[ndarray]:
+        # Same zero padding librosa applies on both ends with center=True
+        block = None
+        for index, block in enumerate(blocks):
+            if index == 0:
+                yield zeros((padding,) + block.shape[1:], dtype=block.dtype)
+            yield block
+        if block is not None:
+            yield zeros((padding,) + block.shape[1:], dtype=block.dtype)
+
+    for block in padded_blocks():
+        if skip:
+            # Drop samples that fall between frames when hop_length exceeds frame_length
+            dropped = min(skip, len(block))
+            block = block[dropped:]
+            skip -= dropped
+
+        pending = block if pending is None else concatenate((pending, block))
+        if len(pending) < frame_length:
+            continue
+
+        # Emit every complete frame and keep the samples from the next frame start onwards
+        frame_count = 1 + (len(pending) - frame_length) // hop_length
+        framed = pending[: (frame_count - 1) * hop_length + frame_length]
+        rms_chunks.append(
+            rms(
+                y=framed.T,
+                frame_length=frame_length,
+                hop_length=hop_length,
+                center=False,
+            )[..., 0, :]
+        )
+
+        next_frame_start = frame_count * hop_length
+        skip = max(0, next_frame_start - len(pending))
+        pending = pending[next_frame_start:]
+
+    return concatenate(rms_chunks, axis=-1)
+
+
+def _non_silent_intervals(
+    frame_rms: ndarray, top_db: float, hop_length: int, audio_length_samples: int
+) -> ndarray:
+    """
+    Converts frame RMS values into non-silent sample intervals, matching librosa.effects.split.
+
+    Args:
+        frame_rms (ndarray): RMS per frame, shaped (frames,) or (channels, frames).
+        top_db (float): The threshold (in decibels) below the peak to consider as silence.
+        hop_length (int): The number of samples between successive analysis frames.
+        audio_length_samples (int): The total length of the audio in samples.
+    Returns:
+        ndarray: The (start, end) sample intervals, shaped (intervals, 2).
+    """
+    decibels = amplitude_to_db(frame_rms, ref=np_max, top_db=None)
+    if decibels.ndim > 1:
+        decibels = decibels.max(axis=0)
+
+    non_silent = decibels > -top_db
+
+    edges = flatnonzero(diff(non_silent.astype(int))) + 1
+    if non_silent[0]:
+        edges = concatenate(([0], edges))
+    if non_silent[-1]:
+        edges = concatenate((edges, [len(non_silent)]))
+
+    return minimum(edges * hop_length, audio_length_samples).reshape((-1, 2))
+
+
+def _is_entirely_non_silent(
+    audio: ndarray, top_db: float, frame_length: int, hop_length: int
+) -> bool:
+    """
+    Checks cheaply whether librosa.effects.split would find no silent frame at all.
+
+    When frames span a whole number of hops and are centered on a hop boundary, each frame's
+    energy is the sum of the energies of the hop-sized blocks it covers, so every sample is squared
+    once instead of once per overlapping frame. Only a clear margin above the threshold counts as
+    non-silent; anything closer is left to librosa.
+
+    Args:
+        audio (ndarray): The audio data, shaped (samples,) or (samples, channels).
+        top_db (float): The threshold (in decibels) below the peak to consider as silence.
+        frame_length (int): The number of samples per analysis frame.
+        hop_length (int): The number of samples between successive analysis frames.
+    Returns:
+        bool: True if every frame is certainly non-silent, False if split must decide.
+    """
+    half_frame = frame_length // 2
+    if frame_length % 2 or half_frame % hop_length:
+        return False
+
+    hops_per_half_frame = half_frame // hop_length
+    full_blocks = len(audio) // hop_length
+    if full_blocks == 0:
+        return False
+
+    # Energy per hop-sized block, with the trailing partial block zero-padded like librosa does
+    blocks = audio[: full_blocks * hop_length].reshape(
+        (full_blocks, hop_length) + audio.shape[1:]
+    )
+    block_energy = [(blocks * blocks).sum(axis=1, dtype=float64)]
+    tail = audio[full_blocks * hop_length :]
+    if len(tail):
+        block_energy.append((tail * tail).sum(axis=0, dtype=float64)[None])
+
+    # The centering padding adds half a frame of silence on each side
+    padding = zeros((hops_per_half_frame,) + audio.shape[1:], dtype=float64)
+    block_energy = concatenate([padding, *block_energy, padding])
+
+    # One frame per hop, each covering frame_length / hop_length consecutive blocks
+    frame_energy = sliding_window_view(
+        block_energy, 2 * hops_per_half_frame, axis=0
+    ).sum(axis=-1)[: 1 + len(audio) // hop_length]
+
+    decibels = amplitude_to_db(
+        sqrt(frame_energy / frame_length), ref=np_max, top_db=None
+    )
+    if decibels.ndim > 1:
+        decibels = decibels.max(axis=1)
+
+    return bool((decibels > PRESCREEN_MARGIN_DB - top_db).all())
+
 
 class SilenceStrategy(BaseStrategy):
     """
@@ -55,39 +220,93 @@ def segment_array_to_timestamps(self, audio: ndarray) -> List[Timestamp]:
             EmptySegmentationError: If no valid segments are produced.
         """
         try:
-            raw_intervals = split(
-                y=audio,
-                top_db=self.silence_settings.top_db,
-                frame_length=self.silence_settings.frame_length,
-                hop_length=self.silence_settings.hop_length,
+            if self.silence_settings.prescreen_non_silent and _is_entirely_non_silent(
+                audio,
+                self.silence_settings.top_db,
+                self.silence_settings.frame_length,
+                self.silence_settings.hop_length,
+            ):
+                # No pause anywhere: split would return the whole audio as one interval
+                raw_intervals = asarray([[0, len(audio)]])
+            else:
+                # Audio is laid out as (samples, channels); librosa expects time on the last axis
+                raw_intervals = split(
+                    y=audio.T,
+                    top_db=self.silence_settings.top_db,
+                    frame_length=self.silence_settings.frame_length,
+                    hop_length=self.silence_settings.hop_length,
+                )
+        except Exception as e:
+            raise SilenceDetectionError(str(e)) from e
+
+        return self._intervals_to_timestamps(raw_intervals, len(audio))
+
+    def segment_stream_to_timestamps(
+        self, blocks: Iterable[ndarray], audio_length_samples: int
+    ) -> List[Timestamp]:
+        """
+        Segments audio delivered as consecutive blocks into timestamps based on detected silence.
+
+        Produces the same intervals as segment_array_to_timestamps while holding only one block
+        and the per-frame RMS values in memory.
+
+        Args:
+            blocks (Iterable[ndarray]): Consecutive, non-overlapping audio blocks.
+            audio_length_samples (int): The total length of the audio in samples.
+        Returns:
+            List[Timestamp]: A list of (start, end) timestamps in seconds for each segment
+        Raises:
+            SilenceDetectionError: If silence detection fails.
+            EmptySegmentationError: If no valid segments are produced.
+        """
+        try:
+            frame_rms = _stream_frame_rms(
+                blocks,
+                self.silence_settings.frame_length,
+                self.silence_settings.hop_length,
+            )
+            raw_intervals = _non_silent_intervals(
+                frame_rms,
+                self.silence_settings.top_db,
+                self.silence_settings.hop_length,
+                audio_length_samples,
             )
         except Exception as e:
             raise SilenceDetectionError(str(e)) from e
-        merged_intervals = []
-        if len(raw_intervals) > 0:
+
+        return self._intervals_to_timestamps(raw_intervals, audio_length_samples)
+
+    def _intervals_to_timestamps(
+        self, raw_intervals: ndarray, audio_length_samples: int
+    ) -> List[Timestamp]:
+        """
+        Merges non-silent intervals separated by short pauses and applies the duration constraints.
+
+        Args:
+            raw_intervals (ndarray): The (start, end) sample intervals of non-silent audio.
+            audio_length_samples (int): The total length of the audio in samples.
+        Returns:
+            List[Timestamp]: A list of (start, end) timestamps in seconds for each segment
+        Raises:
+            EmptySegmentationError: If no valid segments are produced.
+        """
+        raw_intervals = asarray(raw_intervals, dtype=int64).reshape((-1, 2))
+
+        starts = raw_intervals[:, 0]
+        ends = raw_intervals[:, 1]
+
+        if len(raw_intervals) > 1:
             minimum_gap_samples = int(
                 self.silence_settings.minimum_silence_duration
                 * self.audio_settings.sample_rate_hz
             )
 
-            current_start, current_end = raw_intervals[0]
-
-            for next_start, next_end in raw_intervals[1:]:
-                if next_start - current_end < minimum_gap_samples:
-                    current_end = next_end
-                else:
-                    merged_intervals.append((current_start, current_end))
-                    current_start, current_end = next_start, next_end
-
-            merged_intervals.append((current_start, current_end))
-        else:
-            merged_intervals = []
-
-        segments = [
-            {"start": int(start), "end": int(end)} for start, end in merged_intervals
-        ]
+            # Pauses at least the minimum silence long separate segments; shorter ones are merged over
+            split_points = starts[1:] - ends[:-1] >= minimum_gap_samples
+            starts = concatenate((starts[:1], starts[1:][split_points]))
+            ends = concatenate((ends[:-1][split_points], ends[-1:]))
 
-        result = self._process_raw_segments(segments, len(audio))
+        result = self._process_raw_segments(starts, ends, audio_length_samples)
 
         if not result:
             logger.warning(
@@ -1,3 +1,6 @@
+from functools import lru_cache, partial
+from typing import Callable
+
 from segmentation.settings.file import FileType
 from segmentation.exceptions import TemplateError
 
@@ -34,3 +37,28 @@ def format_filename(
 
     extension = file_format.value
     return f"{file_name}.{extension}"
+
+
+@lru_cache(maxsize=64)
+def compile_filename_template(
+    template: str, file_format: FileType
+) -> Callable[[str, int], str]:
+    """
+    Binds a naming template and file format into a filename formatter, validating the template once.
+
+    Formatters are cached per (template, file_format), so strategies sharing the same file settings
+    share them too.
+
+    Args:
+        template (str): The naming template to use for formatting filenames.
+        file_format (FileType): The file format for the output files.
+    Returns:
+        Callable[[str, int], str]: format_filename bound to the template and file format, taking an
+            original name and a segment index.
+    Raises:
+        TemplateError: If the template contains invalid placeholders.
+    """
+    # Fail on unknown placeholders now rather than on the first segment
+    format_filename("", 0, template, file_format)
+
+    return partial(format_filename, template=template, file_format=file_format)
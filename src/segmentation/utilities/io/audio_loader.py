@@ -1,15 +1,210 @@
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from logging import getLogger
+from os import fstat
 from pathlib import Path
+from struct import unpack
+from typing import Optional, Tuple
 
-from librosa import load
-from numpy import ndarray
+from numpy import float32, memmap, ndarray
+from soundfile import LibsndfileError, SoundFile, read
+from soxr import resample
 
-from segmentation.exceptions import AudioLoadError, AudioFormatError, AudioDataError
+from segmentation.exceptions import (
+    AudioLoadError,
+    AudioFormatError,
+    AudioDataError,
+    ConfigurationError,
+)
 
 logger = getLogger(__name__)
 
 
-def load_audio(file_path: Path, sample_rate: int, channels: int) -> ndarray:
+def _downmix(audio: ndarray, channels: int) -> ndarray:
+    """
+    Downmixes (samples, channels) audio to mono when a single channel is requested.
+
+    Args:
+        audio (ndarray): The audio array, shaped (samples,) or (samples, channels).
+        channels (int): Number of audio channels requested (1 for mono, 2 for stereo).
+    Returns:
+        ndarray: The float32 mono mix if requested and the audio is multi-channel, otherwise the audio unchanged.
+    """
+    if channels != 1 or audio.ndim != 2:
+        return audio
+
+    # Adding whole channel columns runs NumPy's vectorized loops over every sample at once,
+    # while a reduction along axis 1 loops per sample over a handful of channels. Channels are
+    # summed one after another, the same order as librosa.to_mono on (channels, samples) audio
+    mono = audio[:, 0].astype(float32)
+    for channel in range(1, audio.shape[1]):
+        mono += audio[:, channel]
+    mono /= audio.shape[1]
+    return mono
+
+
+def _resample(
+    audio: ndarray, native_sample_rate: int, sample_rate: int, res_type: str
+) -> ndarray:
+    """
+    Resamples (samples, channels) audio to the desired sample rate.
+
+    Args:
+        audio (ndarray): The audio array, shaped (samples,) or (samples, channels).
+        native_sample_rate (int): The sample rate of the audio.
+        sample_rate (int): Desired sample rate.
+        res_type (str): The resampling method; soxr methods call libsoxr directly, others go through librosa.
+    Returns:
+        ndarray: The resampled audio, laid out like the input.
+    """
+    if res_type.startswith("soxr_"):
+        return resample(audio, native_sample_rate, sample_rate, quality=res_type)
+
+    from librosa import resample as librosa_resample
+
+    # librosa resamples along the last axis
+    return librosa_resample(
+        audio.T, orig_sr=native_sample_rate, target_sr=sample_rate, res_type=res_type
+    ).T
+
+
+def _map_wav_pcm16(file_path: Path) -> Optional[Tuple[ndarray, int]]:
+    """
+    Memory-maps the samples of a 16-bit PCM WAV file without decoding them.
+
+    Args:
+        file_path (Path): Path to the audio file.
+    Returns:
+        Optional[Tuple[ndarray, int]]: The read-only int16 samples, shaped (samples, channels), and the
+            sample rate; None if the file is not a plain 16-bit PCM WAV file.
+    """
+    if file_path.suffix.lower() != ".wav":
+        return None
+
+    with open(file_path, "rb") as wav_file:
+        file_size = fstat(wav_file.fileno()).st_size
+
+        riff_header = wav_file.read(12)
+        if (
+            len(riff_header) < 12
+            or riff_header[:4] != b"RIFF"
+            or riff_header[8:] != b"WAVE"
+        ):
+            return None
+
+        channels = sample_rate = data_offset = data_size = None
+        while data_offset is None:
+            chunk_header = wav_file.read(8)
+            if len(chunk_header) < 8:
+                return None
+            chunk_id, chunk_size = chunk_header[:4], unpack("<I", chunk_header[4:])[0]
+
+            if chunk_id == b"fmt ":
+                fmt = wav_file.read(chunk_size)
+                if len(fmt) < 16:
+                    return None
+                format_tag, channels, sample_rate = unpack("<HHI", fmt[:8])
+                bits_per_sample = unpack("<H", fmt[14:16])[0]
+                # WAVE_FORMAT_EXTENSIBLE carries the actual format in its sub-format GUID
+                if format_tag == 0xFFFE and len(fmt) >= 26:
+                    format_tag = unpack("<H", fmt[24:26])[0]
+                if format_tag != 1 or bits_per_sample != 16 or channels == 0:
+                    return None
+                wav_file.seek(chunk_size % 2, 1)
+            elif chunk_id == b"data":
+                if channels is None:
+                    return None
+                data_offset, data_size = wav_file.tell(), chunk_size
+            else:
+                # Chunks are padded to an even size
+                wav_file.seek(chunk_size + chunk_size % 2, 1)
+
+    frames = data_size // (2 * channels)
+    if frames == 0 or data_offset + data_size > file_size:
+        return None
+
+    samples = memmap(
+        file_path, dtype="<i2", mode="r", offset=data_offset, shape=(frames, channels)
+    )
+    return samples, sample_rate
+
+
+def _pcm16_to_float32(samples: ndarray, channels: int) -> ndarray:
+    """
+    Converts int16 samples to float32 like libsndfile, downmixing to mono when a single channel is requested.
+
+    Each channel is converted and mixed on its own, so only the output is ever held as float32.
+
+    Args:
+        samples (ndarray): The int16 samples, shaped (samples, channels).
+        channels (int): Number of audio channels requested (1 for mono, 2 for stereo).
+    Returns:
+        ndarray: The float32 audio, shaped (samples,) for a mono result or (samples, channels) otherwise.
+    """
+    # Exact power-of-two scaling, the same as libsndfile's int16 to float conversion
+    scale = float32(1 / 0x8000)
+
+    if samples.shape[1] == 1 or channels == 1:
+        audio = samples[:, 0] * scale
+        if samples.shape[1] > 1:
+            # Same sequential per-channel sum as _downmix, so the mix matches decoding first
+            for channel in range(1, samples.shape[1]):
+                audio += samples[:, channel] * scale
+            audio /= samples.shape[1]
+        return audio
+
+    return samples * scale
+
+
+def _read_audio(
+    file_path: Path, sample_rate: int, channels: int, res_type: str
+) -> Tuple[ndarray, int]:
+    """
+    Decodes an audio file, preferring libsndfile and falling back to librosa for formats it cannot read.
+
+    16-bit PCM WAV files are memory-mapped and converted (and downmixed) straight into the float32
+    result, so the decoded multi-channel audio is never held in memory.
+
+    Args:
+        file_path (Path): Path to the audio file.
+        sample_rate (int): Desired sample rate, only used by the librosa fallback.
+        channels (int): Number of audio channels; the mapped WAV and librosa paths already downmix to it.
+        res_type (str): The resampling method, only used by the librosa fallback.
+    Returns:
+        Tuple[ndarray, int]: The decoded float32 audio, shaped (samples,) or (samples, channels), and its sample rate.
+    """
+    mapped = _map_wav_pcm16(file_path)
+    if mapped is not None:
+        samples, native_sample_rate = mapped
+        return _pcm16_to_float32(samples, channels), native_sample_rate
+
+    try:
+        return read(file_path, dtype="float32", always_2d=False)
+    except LibsndfileError as e:
+        # A missing path or a directory fails here at once instead of going through librosa
+        open(file_path, "rb").close()
+
+        logger.debug(
+            "libsndfile cannot decode %s (%s), falling back to librosa",
+            file_path.name,
+            e,
+        )
+
+    # Imported on first use; files libsndfile can decode never need librosa
+    from librosa import load
+
+    audio, native_sample_rate = load(
+        file_path, sr=sample_rate, mono=(channels == 1), res_type=res_type
+    )
+
+    # librosa returns channels first; keep the (samples, channels) layout used by soundfile
+    return audio.T, native_sample_rate
+
+
+def load_audio(
+    file_path: Path, sample_rate: int, channels: int, res_type: str = "soxr_hq"
+) -> ndarray:
     """
     Loads audio from a file path.
 
@@ -17,25 +212,28 @@ def load_audio(file_path: Path, sample_rate: int, channels: int) -> ndarray:
         file_path (Path): Path to the audio file.
         sample_rate (int): Desired sample rate for loading.
         channels (int): Number of audio channels (1 for mono, 2 for stereo).
+        res_type (str): The resampling method used if the file's sample rate differs (see AudioSettings.res_type).
     Returns:
-        ndarray: Loaded audio array.
+        ndarray: Loaded float32 audio array, shaped (samples,) for mono or (samples, channels) otherwise.
     Raises:
         AudioLoadError: If the file cannot be loaded.
         AudioFormatError: If the audio format is invalid or unsupported.
         AudioDataError: If the loaded audio data is invalid.
     """
-    if not file_path.exists():
-        raise AudioLoadError(str(file_path), "File does not exist")
-
-    if not file_path.is_file():
-        raise AudioLoadError(str(file_path), "Path is not a file")
-
+    # No stat preflight: opening the file is what reports a missing path or a directory
     try:
-        audio, _ = load(
-            file_path,
-            sr=sample_rate,
-            mono=(channels == 1),
+        audio, native_sample_rate = _read_audio(
+            file_path, sample_rate, channels, res_type
         )
+
+        audio = _downmix(audio, channels)
+
+        if native_sample_rate != sample_rate:
+            audio = _resample(audio, native_sample_rate, sample_rate, res_type)
+    except FileNotFoundError as e:
+        raise AudioLoadError(str(file_path), "File does not exist") from e
+    except IsADirectoryError as e:
+        raise AudioLoadError(str(file_path), "Path is not a file") from e
     except Exception as e:
         if "format" in str(e).lower() or "codec" in str(e).lower():
             raise AudioFormatError(str(file_path), details=str(e)) from e
@@ -47,9 +245,104 @@ def load_audio(file_path: Path, sample_rate: int, channels: int) -> ndarray:
     if not isinstance(audio, ndarray):
         raise AudioDataError(f"Expected ndarray, got {type(audio).__name__}")
 
+    # Detection and writing need no more than single precision; never hand float64 downstream
+    if audio.dtype != float32:
+        audio = audio.astype(float32)
+
     logger.debug(
         "Loaded audio file %s with shape %s",
         file_path.name,
         audio.shape,
     )
     return audio
+
+
+def load_audio_prefetch(
+    file_paths: Iterable[Path],
+    sample_rate: int,
+    channels: int,
+    lookahead: int = 2,
+    res_type: str = "soxr_hq",
+) -> Iterator[ndarray]:
+    """
+    Loads audio files in order while the next ones are read in background threads.
+
+    Decoding and resampling mostly run outside the GIL, so reading the upcoming files overlaps
+    with whatever the caller does with the current one.
+
+    Args:
+        file_paths (Iterable[Path]): Paths to the audio files, consumed lazily.
+        sample_rate (int): Desired sample rate for loading.
+        channels (int): Number of audio channels (1 for mono, 2 for stereo).
+        lookahead (int): Maximum number of files loaded ahead of the one being yielded.
+        res_type (str): The resampling method used if a file's sample rate differs (see AudioSettings.res_type).
+    Yields:
+        ndarray: The loaded audio of each file, as returned by load_audio.
+    Raises:
+        ConfigurationError: If lookahead is less than 1.
+        AudioLoadError: If a file cannot be loaded, raised when that file is reached.
+        AudioFormatError: If a file's audio format is invalid or unsupported.
+        AudioDataError: If a file's loaded audio data is invalid.
+    """
+    if lookahead < 1:
+        raise ConfigurationError("lookahead", lookahead, "must be at least 1")
+
+    file_paths = iter(file_paths)
+    pending: deque[Future] = deque()
+
+    with ThreadPoolExecutor(max_workers=lookahead) as executor:
+        try:
+            for file_path in file_paths:
+                pending.append(
+                    executor.submit(
+                        load_audio, Path(file_path), sample_rate, channels, res_type
+                    )
+                )
+                if len(pending) > lookahead:
+                    yield pending.popleft().result()
+
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            # Loads nobody will consume are dropped when the caller stops early or a load fails
+            for future in pending:
+                future.cancel()
+
+
+def iter_audio_blocks(
+    sound_file: SoundFile, block_size: int, channels: int
+) -> Iterator[ndarray]:
+    """
+    Yields consecutive, non-overlapping blocks of an open audio file from its first frame.
+
+    Args:
+        sound_file (SoundFile): The open audio file to read from.
+        block_size (int): Number of samples per block; the last block may be shorter.
+        channels (int): Number of audio channels (1 for mono, 2 for stereo).
+    Yields:
+        ndarray: Float32 audio blocks laid out like load_audio output.
+    """
+    sound_file.seek(0)
+    for block in sound_file.blocks(
+        blocksize=block_size, dtype="float32", always_2d=False
+    ):
+        yield _downmix(block, channels)
+
+
+def read_audio_range(
+    sound_file: SoundFile, start_index: int, end_index: int, channels: int
+) -> ndarray:
+    """
+    Reads the samples in [start_index, end_index) from an open audio file.
+
+    Args:
+        sound_file (SoundFile): The open audio file to read from.
+        start_index (int): The first sample to read.
+        end_index (int): The sample after the last one to read.
+        channels (int): Number of audio channels (1 for mono, 2 for stereo).
+    Returns:
+        ndarray: Float32 audio laid out like load_audio output.
+    """
+    sound_file.seek(start_index)
+    audio = sound_file.read(end_index - start_index, dtype="float32", always_2d=False)
+    return _downmix(audio, channels)
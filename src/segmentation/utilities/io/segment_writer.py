@@ -1,19 +1,200 @@
+from os import (
+    O_CREAT,
+    O_RDONLY,
+    O_TRUNC,
+    O_WRONLY,
+    close,
+    open as os_open,
+    supports_dir_fd,
+)
+from functools import lru_cache
+from io import BytesIO
 from pathlib import Path
+from struct import Struct
+from typing import Optional, Tuple
 
-from numpy import ndarray
-from soundfile import write
+from numpy import (
+    ascontiguousarray,
+    clip,
+    concatenate,
+    errstate,
+    float32,
+    int32,
+    linspace,
+    ndarray,
+    rint,
+)
+from soundfile import SoundFile, available_formats, default_subtype, write
 
 from segmentation.exceptions import SegmentWriteError, AudioDataError
+from segmentation.settings.file import FileType
 
+# Canonical 44-byte RIFF/WAVE header for integer PCM: RIFF, fmt and data chunk headers
+WAV_PCM_HEADER = Struct("<4sI4s4sIHHIIHH4sI")
 
-def write_segment(output_path: Path, audio: ndarray, sample_rate: int) -> None:
+# Largest PCM payload a RIFF header can describe
+WAV_MAX_DATA_SIZE = 0xFFFFFFFF - 36
+
+
+def resolve_sound_format(file_format: FileType) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Resolves the libsndfile major format and default subtype for an output file format.
+
+    Args:
+        file_format (FileType): The file format for the output segmented files.
+    Returns:
+        Tuple[Optional[str], Optional[str]]: The libsndfile format and subtype (e.g. 'WAV', 'PCM_16'),
+            or (None, None) if libsndfile cannot write the format, leaving it to be inferred per file.
+    """
+    sound_format = file_format.value.upper()
+    if sound_format not in available_formats():
+        return None, None
+    return sound_format, default_subtype(sound_format)
+
+
+def open_directory(directory: Path) -> Optional[int]:
+    """
+    Opens a directory so files can be created relative to it without resolving its full path again.
+
+    Args:
+        directory (Path): The existing directory to open.
+    Returns:
+        Optional[int]: The directory file descriptor, or None if the platform cannot open files
+            relative to one. The caller is responsible for closing it.
+    """
+    if os_open not in supports_dir_fd:
+        return None
+
+    # Only defined where dir_fd is supported (POSIX)
+    from os import O_DIRECTORY
+
+    try:
+        return os_open(directory, O_RDONLY | O_DIRECTORY)
+    except OSError:
+        return None
+
+
+def _to_pcm16(audio: ndarray) -> ndarray:
+    """
+    Quantizes float audio to little-endian 16-bit PCM the way libsndfile 1.2 does.
+
+    Args:
+        audio (ndarray): The float32 audio data, in [-1.0, 1.0].
+    Returns:
+        ndarray: The int16 samples, laid out like the input; out-of-range values are clipped.
+    """
+    # libsndfile rounds to 32-bit first and keeps the top 16 bits; scaling by 2**31 is exact
+    scaled = audio * float32(0x80000000)
+    rint(scaled, out=scaled)
+    clip(scaled, -0x80000000, 0x7FFF0000, out=scaled)
+    # NaN has no integer value; libsndfile writes it without complaint, so no warning here either
+    with errstate(invalid="ignore"):
+        return (scaled.astype(int32) >> 16).astype("<i2")
+
+
+def _wav_pcm16_bytes(
+    audio: ndarray, sample_rate: int, channels: int
+) -> Tuple[bytes, ndarray]:
+    """
+    Renders float audio as a 16-bit PCM WAV file.
+
+    Args:
+        audio (ndarray): The float32 audio data, shaped (samples,) or (samples, channels).
+        sample_rate (int): The sample rate of the audio data.
+        channels (int): The number of channels in the audio data.
+    Returns:
+        Tuple[bytes, ndarray]: The WAV header and the PCM samples that follow it.
+    """
+    pcm = _to_pcm16(audio)
+    block_align = channels * 2
+    header = WAV_PCM_HEADER.pack(
+        b"RIFF",
+        36 + pcm.nbytes,
+        b"WAVE",
+        b"fmt ",
+        16,
+        1,  # WAVE_FORMAT_PCM
+        channels,
+        sample_rate,
+        sample_rate * block_align,
+        block_align,
+        16,
+        b"data",
+        pcm.nbytes,
+    )
+    return header, pcm
+
+
+@lru_cache(maxsize=None)
+def _pcm16_matches_libsndfile(channels: int) -> bool:
+    """
+    Checks once per channel count that the direct WAV writer produces the same bytes as libsndfile.
+
+    libsndfile's float to integer conversion has changed between releases, so the direct writer is
+    only used when it reproduces the installed version exactly.
+
+    Args:
+        channels (int): The number of channels in the audio data.
+    Returns:
+        bool: Whether the direct writer can stand in for libsndfile.
+    """
+    # Full-scale sweep including clipped values, plus steps finer than one LSB around zero
+    probe = concatenate(
+        (linspace(-1.5, 1.5, 6001), linspace(-4 / 0x8000, 4 / 0x8000, 4097))
+    ).astype(float32)
+    probe = probe[: len(probe) // channels * channels]
+    if channels > 1:
+        probe = probe.reshape((-1, channels))
+
+    expected = BytesIO()
+    write(expected, probe, 16000, subtype="PCM_16", format="WAV")
+
+    header, pcm = _wav_pcm16_bytes(probe, 16000, channels)
+    return expected.getvalue() == header + pcm.tobytes()
+
+
+def _open_output(output_path: Path, directory_fd: Optional[int]) -> int:
+    """
+    Creates or truncates an output file, relative to its directory's descriptor if one is given.
+
+    Args:
+        output_path (Path): The path of the output file.
+        directory_fd (Optional[int]): An open descriptor of the output path's parent directory.
+    Returns:
+        int: The file descriptor, open for writing.
+    """
+    if directory_fd is None:
+        return os_open(output_path, O_CREAT | O_WRONLY | O_TRUNC, 0o666)
+
+    # A single-component openat instead of walking the whole output path again
+    return os_open(
+        output_path.name, O_CREAT | O_WRONLY | O_TRUNC, 0o666, dir_fd=directory_fd
+    )
+
+
+def write_segment(
+    output_path: Path,
+    audio: ndarray,
+    sample_rate: int,
+    sound_format: Optional[str] = None,
+    subtype: Optional[str] = None,
+    directory_fd: Optional[int] = None,
+    create_parent: bool = True,
+) -> None:
     """
     Writes an audio segment to disk.
 
     Args:
         output_path (Path): The path where the audio segment will be saved.
-        audio (ndarray): The audio data to write.
+        audio (ndarray): The audio data to write. Float audio is written as float32.
         sample_rate (int): The sample rate of the audio data.
+        sound_format (Optional[str]): The libsndfile major format. If None, inferred from the file extension.
+        subtype (Optional[str]): The libsndfile subtype. If None, the format's default subtype is used.
+        directory_fd (Optional[int]): An open descriptor of the output path's parent directory (see
+            open_directory). If given along with sound_format, the file is created relative to it and
+            the parent directory is assumed to exist.
+        create_parent (bool): Whether to create the parent directory first. Callers that already
+            created it can pass False to skip the mkdir call.
     Raises:
         SegmentWriteError: If the segment cannot be written to disk.
         AudioDataError: If the audio data is invalid.
@@ -24,14 +205,58 @@ def write_segment(output_path: Path, audio: ndarray, sample_rate: int) -> None:
     if sample_rate <= 0:
         raise AudioDataError(f"Invalid sample rate: {sample_rate}")
 
-    try:
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-    except Exception as e:
-        raise SegmentWriteError(
-            str(output_path), f"Cannot create parent directory: {e}"
-        ) from e
+    # One contiguous float32 buffer up front instead of a conversion copy inside libsndfile;
+    # integer PCM keeps its dtype, since its scale differs from float audio
+    if audio.dtype.kind == "f" and audio.dtype != float32:
+        audio = ascontiguousarray(audio, dtype=float32)
+    elif not audio.flags.c_contiguous:
+        audio = ascontiguousarray(audio)
+
+    channels = 1 if audio.ndim == 1 else audio.shape[1]
+
+    # Files are only created relative to the directory when the format need not be inferred
+    if sound_format is None:
+        directory_fd = None
+
+    if directory_fd is None and create_parent:
+        try:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+        except Exception as e:
+            raise SegmentWriteError(
+                str(output_path), f"Cannot create parent directory: {e}"
+            ) from e
 
     try:
-        write(output_path, audio, sample_rate)
+        if (
+            sound_format == "WAV"
+            and subtype == "PCM_16"
+            and audio.dtype == float32
+            and audio.size * 2 <= WAV_MAX_DATA_SIZE
+            and _pcm16_matches_libsndfile(channels)
+        ):
+            # Header and samples go out in plain writes, without a libsndfile handle per segment
+            header, pcm = _wav_pcm16_bytes(audio, sample_rate, channels)
+            with open(_open_output(output_path, directory_fd), "wb") as wav_file:
+                wav_file.write(header)
+                wav_file.write(pcm)
+        elif directory_fd is not None:
+            file_descriptor = _open_output(output_path, directory_fd)
+            try:
+                sound_file = SoundFile(
+                    file_descriptor,
+                    "w",
+                    sample_rate,
+                    channels,
+                    subtype,
+                    format=sound_format,
+                )
+            except Exception:
+                close(file_descriptor)
+                raise
+
+            with sound_file:
+                sound_file.write(audio)
+        else:
+            write(output_path, audio, sample_rate, subtype=subtype, format=sound_format)
     except Exception as e:
         raise SegmentWriteError(str(output_path), str(e)) from e
@@ -1,4 +1,6 @@
 from pathlib import Path
+from types import TracebackType
+from typing import Optional, Type
 
 from pydantic import BaseModel, Field
 
@@ -36,6 +38,16 @@ def to_json(self) -> str:
         """
         return self.model_dump_json(indent=4)
 
+    def to_json_bytes(self) -> bytes:
+        """
+        Converts the Manifest instance to UTF-8 encoded JSON, exactly as to_json does.
+
+        Returns:
+            bytes: The encoded JSON representation of the Manifest instance.
+        """
+        # pydantic-core emits bytes natively; model_dump_json would decode them to str first
+        return self.__pydantic_serializer__.to_json(self, indent=4)
+
     def to_json_file(self, file_path: Path) -> None:
         """
         Writes the Manifest instance to a JSON file.
@@ -48,7 +60,77 @@ def to_json_file(self, file_path: Path) -> None:
         from segmentation.exceptions import ManifestError
 
         try:
-            with open(file_path, "w", encoding="utf-8") as json_file:
-                json_file.write(self.to_json())
+            # Binary write with no text layer to re-encode the JSON; the buffered file retries short writes
+            Path(file_path).write_bytes(self.to_json_bytes())
+        except Exception as e:
+            raise ManifestError(str(file_path), str(e)) from e
+
+
+class ManifestWriter:
+    """
+    Writes the manifests of an audio file as lines of a single JSON lines file.
+
+    The file is opened once and written through a large buffer, so appending a manifest costs no
+    system call until the buffer fills. Use it as a context manager, or call close() when done.
+    """
+
+    def __init__(self, file_path: Path, buffer_size: int = 1 << 20) -> None:
+        """
+        Opens the JSON lines file, replacing any previous one.
+
+        Args:
+            file_path (Path): The path to the JSON lines file where the manifests will be saved.
+            buffer_size (int): The number of bytes buffered before they are written to the file.
+        Raises:
+            ManifestError: If the file cannot be opened.
+        """
+        from segmentation.exceptions import ManifestError
+
+        self.file_path = file_path
+
+        try:
+            self._file = open(file_path, "wb", buffering=buffer_size)
         except Exception as e:
             raise ManifestError(str(file_path), str(e)) from e
+
+    def write(self, manifest: Manifest) -> None:
+        """
+        Appends a manifest as a single compact JSON line.
+
+        Args:
+            manifest (Manifest): The manifest to append.
+        Raises:
+            ManifestError: If the manifest cannot be written to the file.
+        """
+        from segmentation.exceptions import ManifestError
+
+        try:
+            self._file.write(manifest.__pydantic_serializer__.to_json(manifest))
+            self._file.write(b"\n")
+        except Exception as e:
+            raise ManifestError(str(self.file_path), str(e)) from e
+
+    def close(self) -> None:
+        """
+        Flushes the buffered manifests and closes the file.
+
+        Raises:
+            ManifestError: If the buffered manifests cannot be written to the file.
+        """
+        from segmentation.exceptions import ManifestError
+
+        try:
+            self._file.close()
+        except Exception as e:
+            raise ManifestError(str(self.file_path), str(e)) from e
+
+    def __enter__(self) -> "ManifestWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
@@ -0,0 +1,97 @@
+from typing import Tuple
+
+from numba import njit
+from numpy import bool_, empty, int64, ndarray
+
+
+@njit(cache=True, boundscheck=False)
+def merge_short_segments(
+    starts: ndarray,
+    ends: ndarray,
+    soft_min_samples: int,
+    hard_max_samples: int,
+    target_samples: int,
+    max_gap_samples: int,
+) -> Tuple[ndarray, ndarray]:
+    """
+    Merges segments shorter than the soft minimum into the adjacent segment that gets closest to the target duration.
+
+    A short segment is only merged when the result stays within the hard maximum and the gap to the
+    neighbour does not exceed the maximum merge gap. After a left merge the grown segment is
+    re-evaluated; after a right merge the grown right segment is evaluated next.
+
+    Args:
+        starts (ndarray): Segment start indices in samples (int64).
+        ends (ndarray): Segment end indices in samples (int64).
+        soft_min_samples (int): Segments shorter than this are merge candidates.
+        hard_max_samples (int): Merges producing a longer segment are rejected.
+        target_samples (int): The preferred merged duration.
+        max_gap_samples (int): The maximum gap between segments that allows merging.
+    Returns:
+        Tuple[ndarray, ndarray]: The merged segment starts and ends in samples.
+    """
+    count = starts.shape[0]
+    start_samples = starts.copy()
+    end_samples = ends.copy()
+
+    # Doubly-linked list over the segments so merges unlink in O(1)
+    previous_index = empty(count, int64)
+    next_index = empty(count, int64)
+    removed = empty(count, bool_)
+    for k in range(count):
+        previous_index[k] = k - 1
+        next_index[k] = k + 1
+        removed[k] = False
+
+    i = 0
+    while i < count:
+        if end_samples[i] - start_samples[i] >= soft_min_samples:
+            i = next_index[i]
+            continue
+
+        left = previous_index[i]
+        right = next_index[i]
+
+        can_merge_left = False
+        score_left = 0
+        if left >= 0:
+            gap = start_samples[i] - end_samples[left]
+            new_duration = end_samples[i] - start_samples[left]
+            if new_duration <= hard_max_samples and gap <= max_gap_samples:
+                can_merge_left = True
+                score_left = abs(new_duration - target_samples)
+
+        can_merge_right = False
+        score_right = 0
+        if right < count:
+            gap = start_samples[right] - end_samples[i]
+            new_duration = end_samples[right] - start_samples[i]
+            if new_duration <= hard_max_samples and gap <= max_gap_samples:
+                can_merge_right = True
+                score_right = abs(new_duration - target_samples)
+
+        if not can_merge_left and not can_merge_right:
+            i = next_index[i]
+            continue
+
+        if left >= 0:
+            next_index[left] = right
+        if right < count:
+            previous_index[right] = left
+        removed[i] = True
+
+        if can_merge_left and (not can_merge_right or score_left <= score_right):
+            end_samples[left] = end_samples[i]
+            i = left
+        else:
+            start_samples[right] = start_samples[i]
+            i = right
+
+    kept = 0
+    for k in range(count):
+        if not removed[k]:
+            start_samples[kept] = start_samples[k]
+            end_samples[kept] = end_samples[k]
+            kept += 1
+
+    return start_samples[:kept], end_samples[:kept]
@@ -1,3 +1,6 @@
+from numpy import int64, ndarray, rint
+
+
 def seconds_to_samples(seconds: float, sample_rate: int) -> int:
     """
     Converts seconds to sample index using rounding to avoid drift.
@@ -9,3 +12,18 @@ def seconds_to_samples(seconds: float, sample_rate: int) -> int:
         int: Corresponding sample index.
     """
     return round(seconds * sample_rate)
+
+
+def seconds_to_samples_array(seconds: ndarray, sample_rate: int) -> ndarray:
+    """
+    Converts an array of times in seconds to sample indices in a single vectorized pass.
+
+    Rounds half to even, matching seconds_to_samples.
+
+    Args:
+        seconds (ndarray): Times in seconds, of any shape.
+        sample_rate (int): Sample rate in Hz.
+    Returns:
+        ndarray: Corresponding sample indices (int64), with the same shape as seconds.
+    """
+    return rint(seconds * sample_rate).astype(int64)
@@ -1,9 +1,25 @@
+from os.path import basename
 from pathlib import Path
 from typing import Optional
 
 from segmentation.exceptions import OutputDirectoryError, ConfigurationError
 
 
+def _stem(name: str) -> str:
+    """
+    Returns the final component of a name without its last suffix, like Path(name).stem.
+
+    Args:
+        name (str): The file name or path.
+    Returns:
+        str: The stem of the final path component.
+    """
+    base = basename(name.rstrip("/"))
+    dot = base.rfind(".")
+    # Leading dots (hidden files) and trailing dots do not start a suffix
+    return base[:dot] if 0 < dot < len(base) - 1 else base
+
+
 def build_output_directory(
     output_directory: str,
     output_in_subdirectory: bool,
@@ -47,7 +63,7 @@ def build_output_directory(
 
     # Add audio file subdirectory if requested
     if output_in_subdirectory:
-        output_path = output_path / Path(original_name).stem
+        output_path = output_path / _stem(original_name)
     
     # Add segment subdirectory if requested
     if output_segment_in_subdirectory:
@@ -65,6 +81,37 @@ def build_output_directory(
     return output_path
 
 
+def build_segment_directory(output_directory: Path, segment_index: int) -> Path:
+    """
+    Creates the subdirectory for a single segment inside an existing output directory.
+
+    Only the leaf directory is created, with a single mkdir call, so build_output_directory should
+    be called once for the audio file before creating its segment directories.
+
+    Args:
+        output_directory (Path): The existing output directory of the audio file.
+        segment_index (int): The index of the segment.
+    Returns:
+        Path: The segment subdirectory path.
+    Raises:
+        OutputDirectoryError: If the directory cannot be created.
+    """
+    segment_directory = output_directory / f"segment_{segment_index}"
+
+    try:
+        segment_directory.mkdir(exist_ok=True)
+    except PermissionError as e:
+        raise OutputDirectoryError(
+            str(segment_directory), f"Permission denied: {e}"
+        ) from e
+    except Exception as e:
+        raise OutputDirectoryError(
+            str(segment_directory), f"Cannot create directory: {e}"
+        ) from e
+
+    return segment_directory
+
+
 def build_path(
     output_directory: Path,
     filename: str,
@@ -1,10 +1,13 @@
+from logging import getLogger
 from pathlib import Path
 from typing import Union
 
-from numpy import ndarray
+from numpy import float64, ndarray
 
 from segmentation.exceptions import AudioDataError
 
+logger = getLogger(__name__)
+
 
 def validate_audio_array(audio: ndarray) -> None:
     """
@@ -24,6 +27,12 @@ def validate_audio_array(audio: ndarray) -> None:
     if audio is None or len(audio) == 0:
         raise AudioDataError("Audio array is empty")
 
+    if audio.dtype == float64:
+        logger.warning(
+            "Audio array is float64; pass float32 audio to halve memory use. "
+            "Audio is processed as float32."
+        )
+
 
 def validate_audio_input(audio: Union[str, Path, ndarray]) -> tuple[bool, str]:
     """